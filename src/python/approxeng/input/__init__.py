@@ -1,7 +1,7 @@
 import logging
 from abc import ABC, abstractmethod
 from math import sqrt
-from time import time
+from time import time, monotonic
 from typing import Optional, Union, Tuple
 import functools
 
@@ -12,6 +12,9 @@ from approxeng.input.sys import sys_nodes
 #: Logger - explicitly set the level for this to see log messages
 logger = logging.getLogger(name='approxeng.input')
 
+#: Battery capacity changes over minutes, so Controller.battery_level re-reads it at most this often, in seconds
+BATTERY_LEVEL_CACHE_SECONDS = 10.0
+
 
 def map_into_range(low, high, raw_value):
     """
@@ -127,7 +130,9 @@ class Controller(ABC):
 
         :param controls:
             A list of :class:`~approxeng.input.Button`, :class:`~approxeng.input.CentredAxis`,
-            :class:`~approxeng.input.TriggerAxis` and :class:`~approxeng.input.BinaryAxis` instances
+            :class:`~approxeng.input.TriggerAxis` and :class:`~approxeng.input.BinaryAxis` instances. Controls hold
+            their own state, so must not be shared between controllers. Drivers define their controls once, at import,
+            as a tuple of functools.partial factories, and call each one to create a fresh set for every new instance.
         :param node_mappings:
             A dict from device name to a prefix which will be applied to all events from nodes with a
             matching name before dispatching the corresponding events. This is used to handle controller
@@ -155,15 +160,17 @@ class Controller(ABC):
                                 isinstance(control, Button) or
                                 isinstance(control, BinaryAxis) or
                                 isinstance(control, TriggerAxis)])
-        if dead_zone is not None:
-            for axis in self.axes.axes:
-                axis.dead_zone = dead_zone
-        if hot_zone is not None:
+        if dead_zone is not None or hot_zone is not None:
             for axis in self.axes.axes:
-                axis.hot_zone = hot_zone
+                if dead_zone is not None:
+                    axis.dead_zone = dead_zone
+                if hot_zone is not None:
+                    axis.hot_zone = hot_zone
         self.node_mappings = node_mappings
         self.device_unique_name = None
         self.exception = None
+        # (device_unique_name, read time, level) from the last battery read, or None
+        self._battery_cache = None
 
         self.ff_device = ff_device
 
@@ -282,18 +289,37 @@ class Controller(ABC):
         if self.device_unique_name is not None:
             sys.write_led_value(self.device_unique_name, led_name, value)
 
+    def write_led_values(self, led_values: dict):
+        """
+        Write values to several named LEDs at once. Does nothing if we're not bound to a device, and skips any LED
+        names which aren't present.
+
+        :param led_values:
+            Dict of LED name to value, where values should be integers.
+        """
+        if self.device_unique_name is not None:
+            sys.write_led_values(self.device_unique_name, led_values)
+
     @property
     def battery_level(self) -> Optional[float]:
         """
-        Read the battery capacity, if available, as a percentage. If not available, return None
+        Read the battery capacity, if available, as a percentage. If not available, return None. The value is re-read
+        from the system at most every :data:`BATTERY_LEVEL_CACHE_SECONDS` seconds.
         """
         if self.device_unique_name is not None:
-            return sys.read_power_level(self.device_unique_name)
+            now = monotonic()
+            cache = self._battery_cache
+            if cache is not None and cache[0] == self.device_unique_name and \
+                    now - cache[1] < BATTERY_LEVEL_CACHE_SECONDS:
+                return cache[2]
+            level = sys.read_power_level(self.device_unique_name)
+            self._battery_cache = (self.device_unique_name, now, level)
+            return level
         return None
 
     @staticmethod
     @abstractmethod
-    def registration_ids() -> [Tuple[int, int]]:
+    def registration_ids() -> Tuple[Tuple[int, int], ...]:
         pass
 
     @property
@@ -332,9 +358,10 @@ class Controller(ABC):
         :return:
             The axis corrected value, or button hold time (None if not held), or AttributeError if sname not found
         """
-        if item in self.axes:
-            return self.axes[item].value
-        elif item in self.buttons:
+        axis = self.axes.axes_by_sname.get(item)
+        if axis is not None:
+            return axis.value
+        elif item in self.buttons.buttons_by_sname:
             return self.buttons.held(item)
         raise AttributeError
 
@@ -549,6 +576,8 @@ class Axis(ABC):
     Abstract base class for axis types.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def value(self) -> float:
@@ -579,6 +608,9 @@ class TriggerAxis(Axis):
     axes.
     """
 
+    __slots__ = ('name', 'max', 'min', '__value', 'dead_zone', 'hot_zone', 'min_raw_value', 'max_raw_value',
+                 'axis_event_code', 'sname', 'buttons', 'button_trigger_value', 'button')
+
     def __init__(self, name: str, min_raw_value: int, max_raw_value: int, axis_event_code: int, dead_zone=0.0,
                  hot_zone=0.0, sname: Optional[str] = None, button_sname: Optional[str] = None,
                  button_trigger_value=0.5):
@@ -702,6 +734,9 @@ class BinaryAxis(Axis):
     but we almost certainly want to treat them as buttons the way most controllers do.
     """
 
+    __slots__ = ('name', 'axis_event_code', 'b1', 'b2', 'buttons', 'last_value', 'sname', '__value', 'dead_zone',
+                 'hot_zone')
+
     def __init__(self, name, axis_event_code, b1name=None, b2name=None):
         """
         Create a new binary axis, used to route axis events through to a pair of buttons, which are created as
@@ -725,6 +760,9 @@ class BinaryAxis(Axis):
         self.last_value = 0
         self.sname = ''
         self.__value = 0
+        # Unused, but the controller applies its dead and hot zones to every axis it holds
+        self.dead_zone = 0.0
+        self.hot_zone = 0.0
 
     def receive_device_value(self, raw_value: int):
         self.__value = raw_value
@@ -826,6 +864,9 @@ class CentredAxis(Axis):
     the control is at 0.0, at least in principle.
     """
 
+    __slots__ = ('name', 'centre', 'max', 'min', '__value', 'invert', 'dead_zone', 'hot_zone', 'min_raw_value',
+                 'max_raw_value', 'raw_scale', 'axis_event_code', 'sname')
+
     def __init__(self, name, min_raw_value, max_raw_value, axis_event_code, dead_zone=0.0, hot_zone=0.0,
                  sname=None):
         """
@@ -857,6 +898,8 @@ class CentredAxis(Axis):
         self.hot_zone = hot_zone
         self.min_raw_value = float(min(min_raw_value, max_raw_value))
         self.max_raw_value = float(max(min_raw_value, max_raw_value))
+        # Scale from raw values to the -1.0 to 1.0 range, fixed by the raw range so only calculated once
+        self.raw_scale = 2 / (self.max_raw_value - self.min_raw_value)
         self.axis_event_code = axis_event_code
         self.sname = sname
 
@@ -871,7 +914,7 @@ class CentredAxis(Axis):
         :return:
             -1.0 at minumum, 1.0 at maximum, linearly interpolating between those two points.
         """
-        return (float(value) - self.min_raw_value) * (2 / (self.max_raw_value - self.min_raw_value)) - 1.0
+        return (float(value) - self.min_raw_value) * self.raw_scale - 1.0
 
     @property
     def raw_value(self) -> float:
@@ -936,6 +979,8 @@ class Button(object):
     A single button on a controller
     """
 
+    __slots__ = ('name', 'key_code', 'sname')
+
     def __init__(self, name, key_code=None, sname=None):
         """
         Create a new Button - this will be done by the controller implementation classes, you shouldn't create your own
@@ -6,12 +6,18 @@ except ModuleNotFoundError:
 import logging
 import os
 import pprint
-from functools import total_ordering
+from functools import total_ordering, lru_cache
 from pathlib import Path
 from typing import List
 
 import yaml
 
+try:
+    # Use the libyaml parser where PyYAML was built with it, it's considerably faster than the pure Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from approxeng.input.dualshock3 import DualShock3
 from approxeng.input.dualshock4 import DualShock4
 from approxeng.input.pihut import PiHut
@@ -28,6 +34,11 @@ from approxeng.input.wiimote import WiiMote
 CUSTOM_CLASSES = [DualShock3, DualShock4, PiHut, SF30Pro, SwitchJoyConLeft, SwitchJoyConRight, WiiMote, SpaceMousePro,
                   SteamController]
 
+# The custom classes are fixed at import, so resolve their 'vendor-product' registrations once here rather than on
+# every call to get_controller_classes
+_BUILT_IN_CLASS_REGISTRY = {f'{vendor_id}-{product_id}': controller_class for controller_class in CUSTOM_CLASSES
+                            for vendor_id, product_id in controller_class.registration_ids()}
+
 try:
     from evdev import InputDevice, list_devices, ecodes, util
 except ImportError:
@@ -199,6 +210,51 @@ def find_matching_controllers(*requirements, **kwargs) -> List[ControllerDiscove
         raise exception
 
 
+@lru_cache(maxsize=None)
+def _built_in_yaml_class_registry():
+    """
+    Build controller classes from the YAML definitions shipped within the library. These can't change while we're
+    running, so this is only done once.
+
+    :return:
+        dict of 'vendor-product' string to controller class
+    """
+    registry = {}
+    package = 'approxeng.input.yaml_controllers'
+    for item in resources.contents(package):
+        if item.endswith('.yaml') and resources.is_resource(package, item):
+            yaml_bytes = resources.read_binary(package, item)
+            controller_class = Profile(d=yaml.load(yaml_bytes, Loader=_YamlLoader)).build_controller_class()
+            for vendor_id, product_id in controller_class.registration_ids():
+                registry[f'{vendor_id}-{product_id}'] = controller_class
+    return registry
+
+
+# Controller classes built from YAML files on disk, keyed by resolved path, with values of (st_mtime_ns, class)
+_YAML_FILE_CLASS_CACHE = {}
+
+
+def _controller_class_from_yaml_file(path: Path):
+    """
+    Build a controller class from a YAML definition file, re-using the class built last time if the file hasn't been
+    modified since.
+
+    :param path:
+        Path to the YAML file
+    :return:
+        A controller class
+    """
+    key = path.resolve()
+    mtime = key.stat().st_mtime_ns
+    cached = _YAML_FILE_CLASS_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(key, 'rb') as file:
+        controller_class = Profile(d=yaml.load(file, Loader=_YamlLoader)).build_controller_class()
+    _YAML_FILE_CLASS_CACHE[key] = mtime, controller_class
+    return controller_class
+
+
 def get_controller_classes(scan_home=True, additional_locations=None):
     """
     Get a map of 'vendor-product' string to controller class. This loads known 'complex' controller classes
@@ -213,21 +269,6 @@ def get_controller_classes(scan_home=True, additional_locations=None):
         for additional YAML definitions. If this is a single string it will be wrapped automatically in a list
     """
 
-    def built_in_classes():
-        for controller_class in CUSTOM_CLASSES:
-            for vendor_id, product_id in controller_class.registration_ids():
-                yield f'{vendor_id}-{product_id}', controller_class
-
-    def built_in_yaml_definitions():
-        package = 'approxeng.input.yaml_controllers'
-        for item in resources.contents(package):
-            if item.endswith('.yaml') and resources.is_resource(package, item):
-                yaml_string = resources.read_text('approxeng.input.yaml_controllers', item)
-                profile = Profile(d=yaml.load(yaml_string, Loader=yaml.SafeLoader))
-                controller_class = profile.build_controller_class()
-                for vendor_id, product_id in controller_class.registration_ids():
-                    yield f'{vendor_id}-{product_id}', controller_class
-
     def yaml_definitions_from_path(path: Path):
         if not path.exists():
             logger.info(f'Creating new definition directory {path}')
@@ -237,14 +278,12 @@ def get_controller_classes(scan_home=True, additional_locations=None):
             return
         for entry in path.glob('*.yaml'):
             if entry.is_file():
-                with open(entry, 'r') as file:
-                    profile = Profile(d=yaml.load(file, Loader=yaml.SafeLoader))
-                    controller_class = profile.build_controller_class()
-                    for vendor_id, product_id in controller_class.registration_ids():
-                        yield f'{vendor_id}-{product_id}', controller_class
-
-    controllers = {key: value for key, value in built_in_classes()}
-    controllers.update({key: value for key, value in built_in_yaml_definitions()})
+                controller_class = _controller_class_from_yaml_file(entry)
+                for vendor_id, product_id in controller_class.registration_ids():
+                    yield f'{vendor_id}-{product_id}', controller_class
+
+    controllers = dict(_BUILT_IN_CLASS_REGISTRY)
+    controllers.update(_built_in_yaml_class_registry())
     if scan_home:
         controllers.update({key: value for key, value in yaml_definitions_from_path(Path.home() / '.approxeng.input')})
     if additional_locations is not None and isinstance(additional_locations, str):
@@ -274,16 +313,29 @@ def find_all_controllers(**kwargs) -> List[ControllerDiscovery]:
         logger.info(f'No controller defined for device {d}')
         return None
 
-    all_devices = list(InputDevice(path) for path in list_devices())
-
-    devices_by_name = {name: list(e for e in all_devices if unique_name(e) == name) for name in
-                       set(unique_name(e) for e in all_devices if
-                           controller_constructor(e) is not None)}
+    # Group devices by physical controller in a single pass, resolving each device's class once. A controller is
+    # created from the first class found among a group's devices.
+    devices_by_name = {}
+    class_by_name = {}
+    for path in list_devices():
+        device = InputDevice(path)
+        name = unique_name(device)
+        devices_by_name.setdefault(name, []).append(device)
+        if name not in class_by_name:
+            controller_class = controller_constructor(device)
+            if controller_class is not None:
+                class_by_name[name] = controller_class
+
+    # Devices which don't belong to any recognised controller aren't needed, so release their file handles now
+    for name, devices in devices_by_name.items():
+        if name not in class_by_name:
+            for device in devices:
+                device.close()
 
     controllers = sorted(
-        ControllerDiscovery(controller_class=controller_constructor(devices[0]), controller_constructor_args=kwargs,
-                            devices=devices, name=name) for
-        name, devices in devices_by_name.items())
+        ControllerDiscovery(controller_class=class_by_name[name], controller_constructor_args=kwargs,
+                            devices=devices_by_name[name], name=name) for
+        name in class_by_name)
 
     return controllers
 
@@ -310,25 +362,28 @@ def device_verbose_info(device: InputDevice):
         except KeyError:
             return 'EXTENDED_CODE_{}'.format(axis_code)
 
+    # Each call to capabilities() is an ioctl round trip, so only ask once
+    capabilities = device.capabilities()
+
     axes = None
-    if device.capabilities().get(3) is not None:
+    if capabilities.get(3) is not None:
         axes = {
             axis_name(axis_code): {'code': axis_code, 'min': axis_info.min, 'max': axis_info.max,
                                    'fuzz': axis_info.fuzz,
                                    'flat': axis_info.flat, 'res': axis_info.resolution} for
-            axis_code, axis_info in device.capabilities().get(3)}
+            axis_code, axis_info in capabilities.get(3)}
 
     rel_axes = None
-    if device.capabilities().get(2) is not None:
-        print(device.capabilities().get(2))
+    if capabilities.get(2) is not None:
+        print(capabilities.get(2))
         rel_axes = {
             rel_axis_name(axis_code): {'code': axis_code} for
-            axis_code in device.capabilities().get(2)}
+            axis_code in capabilities.get(2)}
 
     buttons = None
-    if device.capabilities().get(1) is not None:
+    if capabilities.get(1) is not None:
         buttons = {code: names for (names, code) in
-                   dict(util.resolve_ecodes_dict({1: device.capabilities().get(1)})).get(('EV_KEY', 1))}
+                   dict(util.resolve_ecodes_dict({1: capabilities.get(1)})).get(('EV_KEY', 1))}
 
     return {'fn': device.fn, 'path': device.path, 'name': device.name, 'phys': device.phys, 'uniq': device.uniq,
             'vendor': device.info.vendor, 'product': device.info.product, 'version': device.info.version,
@@ -337,31 +392,39 @@ def device_verbose_info(device: InputDevice):
 
 
 def get_valid_devices():
-    def has_abs_axes(device):
-        return device.capabilities().get(3) is not None
-
-    def has_rel_axes(device):
-        return device.capabilities().get(2) is not None
-
+    """
+    Generator over the InputDevices which have absolute or relative axes. Devices are opened one at a time as the
+    generator advances, and any which don't qualify are closed straight away.
+    """
     _check_import()
-    for d in [InputDevice(fn) for fn in list_devices()]:
-        if has_abs_axes(d) or has_rel_axes(d):
+    for fn in list_devices():
+        d = InputDevice(fn)
+        capabilities = d.capabilities()
+        if capabilities.get(3) is not None or capabilities.get(2) is not None:
             yield d
+        else:
+            d.close()
+
+
+class _HexPrettyPrinter(pprint.PrettyPrinter):
+    """
+    Pretty printer which shows integers in hex, used by print_devices
+    """
+
+    def format(self, object, context, maxlevels, level):
+        if isinstance(object, int):
+            return '0x{:X}'.format(object), True, False
+        return super().format(object, context, maxlevels, level)
 
 
 def print_devices():
     """
     Simple test function which prints out all devices found by evdev
     """
+    pp = _HexPrettyPrinter(indent=2, width=100)
     for d in get_valid_devices():
-        class MyPrettyPrinter(pprint.PrettyPrinter):
-            def format(self, object, context, maxlevels, level):
-                if isinstance(object, int):
-                    return '0x{:X}'.format(object), True, False
-                return super().format(object, context, maxlevels, level)
-
-        pp = MyPrettyPrinter(indent=2, width=100)
         pp.pprint(device_verbose_info(d))
+        d.close()
 
 
 def print_controllers():
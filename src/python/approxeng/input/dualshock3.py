@@ -1,8 +1,49 @@
+from functools import partial
+from types import MappingProxyType
+
 from approxeng.input import CentredAxis, Controller, Button, TriggerAxis
 
 __all__ = ['DualShock3']
 
 
+_DS3_CONTROLS = (
+    partial(Button, "Select", 314, sname='select'),
+    partial(Button, "Left Stick", 317, sname='ls'),
+    partial(Button, "Right Stick", 318, sname='rs'),
+    partial(Button, "Start", 315, sname='start'),
+    partial(Button, "D Up", 544, sname='dup'),
+    partial(Button, "D Right", 547, sname='dright'),
+    partial(Button, "D Down", 545, sname='ddown'),
+    partial(Button, "D Left", 546, sname='dleft'),
+    partial(Button, "L2", 312, sname='l2'),
+    partial(Button, "R2", 313, sname='r2'),
+    partial(Button, "L1", 310, sname='l1'),
+    partial(Button, "R1", 311, sname='r1'),
+    partial(Button, "Triangle", 307, sname='triangle'),
+    partial(Button, "Circle", 305, sname='circle'),
+    partial(Button, "Cross", 304, sname='cross'),
+    partial(Button, "Square", 308, sname='square'),
+    partial(Button, "Home (PS)", 316, sname='home'),
+    partial(TriggerAxis, "Left Trigger", 0, 255, 2, sname='lt'),
+    partial(TriggerAxis, "Right Trigger", 0, 255, 5, sname='rt'),
+    partial(CentredAxis, "Left Vertical", 255, 0, 1, sname='ly'),
+    partial(CentredAxis, "Right Vertical", 255, 0, 4, sname='ry'),
+    partial(CentredAxis, "Left Horizontal", 0, 255, 0, sname='lx'),
+    partial(CentredAxis, "Right Horizontal", 0, 255, 3, sname='rx'),
+    partial(CentredAxis, "Motion 0", 127, -128, 'motion0', sname='roll'),
+    partial(CentredAxis, "Motion 2", 127, -128, 'motion2', sname='pitch'),
+)
+
+
+_DS3_REGISTRATION_IDS = ((0x54c, 0x268),)
+
+# Device node names for the extra evdev nodes this controller exposes, mapped to the prefix used in their control codes
+_DS3_NODE_MAPPINGS = MappingProxyType({'Sony PLAYSTATION(R)3 Controller Motion Sensors': 'motion'})
+
+# LED names as they appear under /sys/class/leds, indexed by led_number - 1
+_LED_NAMES = ('sony1', 'sony2', 'sony3', 'sony4')
+
+
 class DualShock3(Controller):
     """
     Driver for the Sony PlayStation 3 controller, the DualShock3
@@ -17,34 +58,8 @@ class DualShock3(Controller):
         :param float hot_zone:
             Used to set the hot zone for each :class:`approxeng.input.CentredAxis` in the controller.
         """
-        super(DualShock3, self).__init__(controls=[
-            Button("Select", 314, sname='select'),
-            Button("Left Stick", 317, sname='ls'),
-            Button("Right Stick", 318, sname='rs'),
-            Button("Start", 315, sname='start'),
-            Button("D Up", 544, sname='dup'),
-            Button("D Right", 547, sname='dright'),
-            Button("D Down", 545, sname='ddown'),
-            Button("D Left", 546, sname='dleft'),
-            Button("L2", 312, sname='l2'),
-            Button("R2", 313, sname='r2'),
-            Button("L1", 310, sname='l1'),
-            Button("R1", 311, sname='r1'),
-            Button("Triangle", 307, sname='triangle'),
-            Button("Circle", 305, sname='circle'),
-            Button("Cross", 304, sname='cross'),
-            Button("Square", 308, sname='square'),
-            Button("Home (PS)", 316, sname='home'),
-            TriggerAxis("Left Trigger", 0, 255, 2, sname='lt'),
-            TriggerAxis("Right Trigger", 0, 255, 5, sname='rt'),
-            CentredAxis("Left Vertical", 255, 0, 1, sname='ly'),
-            CentredAxis("Right Vertical", 255, 0, 4, sname='ry'),
-            CentredAxis("Left Horizontal", 0, 255, 0, sname='lx'),
-            CentredAxis("Right Horizontal", 0, 255, 3, sname='rx'),
-            CentredAxis("Motion 0", 127, -128, 'motion0', sname='roll'),
-            CentredAxis("Motion 2", 127, -128, 'motion2', sname='pitch'),
-        ],
-            node_mappings={'Sony PLAYSTATION(R)3 Controller Motion Sensors': 'motion'},
+        super(DualShock3, self).__init__(controls=[control() for control in _DS3_CONTROLS],
+            node_mappings=_DS3_NODE_MAPPINGS,
             dead_zone=dead_zone,
             hot_zone=hot_zone,
             **kwargs)
@@ -54,9 +69,9 @@ class DualShock3(Controller):
     @staticmethod
     def registration_ids():
         """
-        :return: list of (vendor_id, product_id) for this controller
+        :return: tuple of (vendor_id, product_id) for this controller
         """
-        return [(0x54c, 0x268)]
+        return _DS3_REGISTRATION_IDS
 
     def __repr__(self):
         return 'Sony DualShock3 (Playstation 3) controller'
@@ -71,6 +86,6 @@ class DualShock3(Controller):
         :param led_value:
             Value, set to 0 to turn the LED off, 1 to turn it on
         """
-        if 1 > led_number > 4:
+        if not 1 <= led_number <= 4:
             return
-        self.write_led_value(led_name='sony{}'.format(led_number), value=led_value)
+        self.write_led_value(led_name=_LED_NAMES[led_number - 1], value=led_value)
@@ -1,4 +1,5 @@
-from colorsys import hsv_to_rgb
+from functools import partial
+from types import MappingProxyType
 
 from approxeng.input import Controller, Button, CentredAxis, TriggerAxis, BinaryAxis
 
@@ -9,6 +10,47 @@ __all__ = ['DualShock4']
 # bluetooth MAC of the controller.
 
 
+_DS4_CONTROLS = (
+    partial(Button, "Circle", 305, sname='circle'),
+    partial(Button, "Cross", 304, sname='cross'),
+    partial(Button, "Square", 308, sname='square'),
+    partial(Button, "Triangle", 307, sname='triangle'),
+    partial(Button, "Home (PS)", 316, sname='home'),
+    partial(Button, "Share", 314, sname='select'),
+    partial(Button, "Options", 315, sname='start'),
+    partial(Button, "Trackpad", 'touch272', sname='ps4_pad'),
+    partial(Button, "L1", 310, sname='l1'),
+    partial(Button, "R1", 311, sname='r1'),
+    partial(Button, "L2", 312, sname='l2'),
+    partial(Button, "R2", 313, sname='r2'),
+    partial(Button, "Left Stick", 317, sname='ls'),
+    partial(Button, "Right Stick", 318, sname='rs'),
+    partial(CentredAxis, "Left Horizontal", 0, 255, 0, sname='lx'),
+    partial(CentredAxis, "Left Vertical", 255, 0, 1, sname='ly'),
+    partial(CentredAxis, "Right Horizontal", 0, 255, 3, sname='rx'),
+    partial(CentredAxis, "Right Vertical", 255, 0, 4, sname='ry'),
+    partial(TriggerAxis, "Left Trigger", 0, 255, 2, sname='lt'),
+    partial(TriggerAxis, "Right Trigger", 0, 255, 5, sname='rt'),
+    partial(BinaryAxis, "D-pad Horizontal", 16, b1name='dleft', b2name='dright'),
+    partial(BinaryAxis, "D-pad Vertical", 17, b1name='dup', b2name='ddown'),
+    partial(CentredAxis, "Yaw rate", 2097152, -2097152, 'motion4', sname='yaw_rate'),
+    partial(CentredAxis, "Roll", 8500, -8500, 'motion0', sname='roll'),
+    partial(CentredAxis, "Pitch", 8500, -8500, 'motion2', sname='pitch'),
+    partial(CentredAxis, "Touch X", 0, 1920, 'touch53', sname='tx'),
+    partial(CentredAxis, "Touch Y", 942, 0, 'touch54', sname='ty'),
+)
+
+
+_DS4_REGISTRATION_IDS = ((0x54c, 0x9cc), (0x54c, 0x5c4))
+
+# Device node names for the extra evdev nodes this controller exposes, mapped to the prefix used in their control codes
+_DS4_NODE_MAPPINGS = MappingProxyType({
+    'Sony Interactive Entertainment Wireless Controller Touchpad': 'touch',
+    'Sony Interactive Entertainment Wireless Controller Motion Sensors': 'motion',
+    'Wireless Controller Touchpad': 'touch',
+    'Wireless Controller Motion Sensors': 'motion'})
+
+
 class DualShock4(Controller):
     """
     Driver for the Sony PlayStation 4 controller, the DualShock4
@@ -23,41 +65,8 @@ class DualShock4(Controller):
         :param float hot_zone:
             Used to set the hot zone for each :class:`~approxeng.input.CentredAxis` in the controller.
         """
-        super(DualShock4, self).__init__(controls=[
-            Button("Circle", 305, sname='circle'),
-            Button("Cross", 304, sname='cross'),
-            Button("Square", 308, sname='square'),
-            Button("Triangle", 307, sname='triangle'),
-            Button("Home (PS)", 316, sname='home'),
-            Button("Share", 314, sname='select'),
-            Button("Options", 315, sname='start'),
-            Button("Trackpad", 'touch272', sname='ps4_pad'),
-            Button("L1", 310, sname='l1'),
-            Button("R1", 311, sname='r1'),
-            Button("L2", 312, sname='l2'),
-            Button("R2", 313, sname='r2'),
-            Button("Left Stick", 317, sname='ls'),
-            Button("Right Stick", 318, sname='rs'),
-            CentredAxis("Left Horizontal", 0, 255, 0, sname='lx'),
-            CentredAxis("Left Vertical", 255, 0, 1, sname='ly'),
-            CentredAxis("Right Horizontal", 0, 255, 3, sname='rx'),
-            CentredAxis("Right Vertical", 255, 0, 4, sname='ry'),
-            TriggerAxis("Left Trigger", 0, 255, 2, sname='lt'),
-            TriggerAxis("Right Trigger", 0, 255, 5, sname='rt'),
-            BinaryAxis("D-pad Horizontal", 16, b1name='dleft', b2name='dright'),
-            BinaryAxis("D-pad Vertical", 17, b1name='dup', b2name='ddown'),
-            CentredAxis("Yaw rate", 2097152, -2097152, 'motion4', sname='yaw_rate'),
-            CentredAxis("Roll", 8500, -8500, 'motion0', sname='roll'),
-            CentredAxis("Pitch", 8500, -8500, 'motion2', sname='pitch'),
-            CentredAxis("Touch X", 0, 1920, 'touch53', sname='tx'),
-            CentredAxis("Touch Y", 942, 0, 'touch54', sname='ty')
-
-        ],
-            node_mappings={
-                'Sony Interactive Entertainment Wireless Controller Touchpad': 'touch',
-                'Sony Interactive Entertainment Wireless Controller Motion Sensors': 'motion',
-                'Wireless Controller Touchpad': 'touch',
-                'Wireless Controller Motion Sensors': 'motion'},
+        super(DualShock4, self).__init__(controls=[control() for control in _DS4_CONTROLS],
+            node_mappings=_DS4_NODE_MAPPINGS,
             dead_zone=dead_zone,
             hot_zone=hot_zone,
             **kwargs)
@@ -67,10 +76,9 @@ class DualShock4(Controller):
     @staticmethod
     def registration_ids():
         """
-        :return: list of (vendor_id, product_id) for this controller
+        :return: tuple of (vendor_id, product_id) for this controller
         """
-        return [(0x54c, 0x9cc),
-                (0x54c, 0x5c4)]
+        return _DS4_REGISTRATION_IDS
 
     def __repr__(self) -> str:
         return 'Sony DualShock4 (Playstation 4) controller'
@@ -88,7 +96,12 @@ class DualShock4(Controller):
             Value of the colour (i.e. how bright the light is overall), defaults to 1.0, specified as a floating point
             value between 0.0 and 1.0
         """
-        r, g, b = hsv_to_rgb(hue, saturation, value)
-        self.write_led_value('red', r * 255.0)
-        self.write_led_value('green', g * 255.0)
-        self.write_led_value('blue', b * 255.0)
+        # Inline equivalent of colorsys.hsv_to_rgb, picking the RGB ordering for the hue sextant from a table
+        h6 = hue * 6.0
+        i = int(h6)
+        f = h6 - i
+        p = value * (1.0 - saturation)
+        q = value * (1.0 - saturation * f)
+        t = value * (1.0 - saturation * (1.0 - f))
+        r, g, b = ((value, t, p), (q, value, p), (p, value, t), (p, q, value), (t, p, value), (value, p, q))[i % 6]
+        self.write_led_values({'red': r * 255.0, 'green': g * 255.0, 'blue': b * 255.0})
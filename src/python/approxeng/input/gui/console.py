@@ -37,27 +37,41 @@ def show_controls():
         curses.start_color()
         last_presses = None
 
+        # Colour attributes only need looking up once the pairs are initialised
+        red_attr = curses.color_pair(1)
+        green_attr = curses.color_pair(2)
+        yellow_attr = curses.color_pair(3)
+        magenta_attr = curses.color_pair(4)
+
         def red(s):
-            screen.addstr(s, curses.color_pair(1))
+            screen.addstr(s, red_attr)
 
         def green(s):
-            screen.addstr(s, curses.color_pair(2))
+            screen.addstr(s, green_attr)
 
         def yellow(s):
-            screen.addstr(s, curses.color_pair(3))
+            screen.addstr(s, yellow_attr)
 
         def magenta(s):
-            screen.addstr(s, curses.color_pair(4))
+            screen.addstr(s, magenta_attr)
 
         # Loop forever
         while True:
             try:
                 with ControllerResource() as joystick:
+                    # These don't change while the controller is connected, and names builds a new sorted list
+                    # on each access, so fetch them once rather than on every frame
+                    axis_names = joystick.axes.names
+                    button_names = joystick.buttons.names
+                    class_text = 'controller class: {}'.format(type(joystick).__name__)
+                    name_text = 'controller name: {}'.format(joystick.__repr__())
+                    controls_text = pprint.pformat(joystick.controls, indent=2)
                     while joystick.connected:
                         # Check for presses since the last time we checked
                         joystick.check_presses()
 
-                        screen.clear()
+                        # Erase rather than clear, so curses only sends the cells which changed since the last frame
+                        screen.erase()
 
                         if joystick.has_presses:
                             last_presses = joystick.presses
@@ -70,7 +84,7 @@ def show_controls():
 
                         # Print axis values
                         screen.addstr(1, 0, 'axes:')
-                        for axis_name in joystick.axes.names:
+                        for axis_name in axis_names:
                             screen.addstr(' {}='.format(axis_name))
                             axis_value = joystick[axis_name]
                             if not isinstance(axis_value, tuple):
@@ -88,24 +102,25 @@ def show_controls():
 
                         # Print button hold times
                         screen.addstr(2, 0, 'hold times:')
-                        for button_name in joystick.buttons.names:
+                        for button_name in button_names:
                             hold_time = joystick[button_name]
                             if hold_time is not None:
                                 screen.addstr(' {}='.format(button_name))
                                 green('{:.1f}'.format(hold_time))
 
                         # Print some details of the controller
-                        screen.addstr(3, 0, 'controller class: {}'.format(type(joystick).__name__))
-                        screen.addstr(4, 0, 'controller name: {}'.format(joystick.__repr__()))
+                        screen.addstr(3, 0, class_text)
+                        screen.addstr(4, 0, name_text)
                         battery_level = joystick.battery_level
                         if battery_level:
-                            screen.addstr(5, 0, 'battery_level: {:.2f}'.format(joystick.battery_level))
-                        screen.addstr(6, 0, pprint.pformat(joystick.controls, indent=2))
+                            screen.addstr(5, 0, 'battery_level: {:.2f}'.format(battery_level))
+                        screen.addstr(6, 0, controls_text)
 
-                        screen.refresh()
+                        screen.noutrefresh()
+                        curses.doupdate()
                         sleep(0.05)
             except IOError:
-                screen.clear()
+                screen.erase()
                 screen.addstr(0, 0, 'Waiting for controller')
                 screen.refresh()
                 sleep(1.0)
@@ -1,26 +1,22 @@
 # Simple command-line tool to list controller classes in a tabular form
 from approxeng.input.controllers import get_controller_classes
-from dataclasses import dataclass
 
 
 def show_controller_classes():
-    @dataclass(order=True)
-    class ControllerMeta:
-        vendor: int
-        product: int
-        name: str
-        class_name: str
-
-    def controller_meta():
-        for id_string, c_class in get_controller_classes().items():
-            vendor, product = id_string.split('-')
-            name = c_class().__repr__()
-            class_name = c_class.__name__
-            yield ControllerMeta(int(vendor), int(product), name, class_name)
-
-    # noinspection PyTypeChecker
-    if meta_classes := sorted(controller_meta()):
-        tuples = [(f'{meta.vendor:04x}', f'{meta.product:04x}', meta.name, meta.class_name) for meta in meta_classes]
+    # Rows are (vendor, product, name, class name) tuples, which sort by vendor then product. Classes registered under
+    # more than one id are only instantiated once to get their name.
+    names = {}
+    meta_rows = []
+    for id_string, c_class in get_controller_classes().items():
+        vendor, product = id_string.split('-')
+        if c_class not in names:
+            names[c_class] = c_class().__repr__()
+        meta_rows.append((int(vendor), int(product), names[c_class], c_class.__name__))
+
+    if meta_rows:
+        meta_rows.sort()
+        tuples = [(f'{vendor:04x}', f'{product:04x}', name, class_name) for vendor, product, name, class_name in
+                  meta_rows]
         print(table(tuples, 'Vendor', 'Product', 'Controller Name', 'Class'))
     else:
         print('No available controller classes!')
@@ -38,10 +34,18 @@ def table(tuples, *headers):
     :return:
         A formatted string with newlines and using box characters to represent the data in tabular form
     """
-    lengths = [max([len(items[i]) for items in tuples] + [len(headers[i])]) for i, _ in enumerate(headers)]
+    # Column widths in a single pass over the rows
+    lengths = [len(header) for header in headers]
+    for items in tuples:
+        for i, item in enumerate(items):
+            if len(item) > lengths[i]:
+                lengths[i] = len(item)
+
+    # Row format string, built once and shared by every row
+    row_format = '\u2502 ' + ' \u2502 '.join(f'{{:{length}}}' for length in lengths) + ' \u2502'
 
     def row(items):
-        return '\u2502 ' + ' \u2502 '.join([f'{items[i]:{lengths[i]}}' for i, _ in enumerate(lengths)]) + ' \u2502'
+        return row_format.format(*items)
 
     def furniture(left, mid, right):
         return left + mid.join('\u2500' * (length + 2) for length in lengths) + right
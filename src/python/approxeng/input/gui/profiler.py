@@ -2,7 +2,6 @@ import curses
 import curses.textpad
 import re
 import signal
-from math import floor
 
 import yaml
 from evdev import InputDevice
@@ -66,52 +65,67 @@ def build_profiler_gui(device: InputDevice, button_keys=DEFAULT_BUTTON_KEYS, axi
 
     signal.signal(signal.SIGINT, signal_handler)
 
+    # Buttons are shown four to a row, axes two to a row
+    button_rows = (len(BUTTON_NAMES) + 3) // 4
+    axis_rows = (len(AXIS_NAMES) + 1) // 2
+
+    # Map selection keys straight to the control they select, ignoring any keys beyond the number of controls
+    button_by_key = {key: button for key, button in zip(button_keys, BUTTON_NAMES)}
+    axis_by_key = {key: axis for key, axis in zip(axis_keys, AXIS_NAMES)}
+
     def curses_main(screen):
         try:
             display = DisplayState(screen=screen, profile=profile, profiler=profiler, axis_keys=axis_keys,
                                    button_keys=button_keys)
             curses.cbreak()
             curses.halfdelay(1)
+            # Version of the profiler state last drawn, None forces a redraw
+            drawn_version = None
             while True:
-                display.start()
-                display.println('Approxeng.input controller profiling tool')
-                display.println('Select axis or button and activate corresponding control')
-                display.println(f'File : {filename}')
-                display.println(f'CTRL-C to exit and save YAML definition file')
-                # display.println(f'{profiler.axis_changes}')
-                display.newline()
-
-                display.print_header('Buttons')
-                for index, button in enumerate(BUTTON_NAMES):
-                    row, col = divmod(index, 4)
-                    display.show_button(display.line + row, col * 20, button)
-                display.line += floor((len(BUTTON_NAMES) - 1) / 4) + 1
-                display.newline()
-
-                display.print_header('Axes')
-                for index, axis in enumerate(AXIS_NAMES):
-                    row, col = divmod(index, 2)
-                    display.show_axis(display.line + row, col * 40, axis)
-                display.line += floor((len(AXIS_NAMES) - 1) / 2) + 1
-                display.newline()
-
-                if display.control_is_button:
-                    display.println('Button selected - press control to assign or BACKSPACE to clear')
-                elif display.control_is_axis:
-                    if display.control[0] == 'd':
-                        display.println('Binary axis, press both corresponding buttons to assign')
-                    else:
-                        display.println('Analogue axis, move control to full extent to assign')
-                    display.println('SPACE to toggle inversion, BACKSPACE to toggle enable / disable')
+                # Only redraw when the profiler has seen new events or a key has been handled since the last draw
+                if profiler.version != drawn_version:
+                    drawn_version = profiler.version
+                    display.start()
+                    display.println('Approxeng.input controller profiling tool')
+                    display.println('Select axis or button and activate corresponding control')
+                    display.println(f'File : {filename}')
+                    display.println(f'CTRL-C to exit and save YAML definition file')
+                    # display.println(f'{profiler.axis_changes}')
+                    display.newline()
+
+                    display.print_header('Buttons')
+                    for index, button in enumerate(BUTTON_NAMES):
+                        row, col = divmod(index, 4)
+                        display.show_button(display.line + row, col * 20, button)
+                    display.line += button_rows
+                    display.newline()
+
+                    display.print_header('Axes')
+                    for index, axis in enumerate(AXIS_NAMES):
+                        row, col = divmod(index, 2)
+                        display.show_axis(display.line + row, col * 40, axis)
+                    display.line += axis_rows
+                    display.newline()
+
+                    if display.control_is_button:
+                        display.println('Button selected - press control to assign or BACKSPACE to clear')
+                    elif display.control_is_axis:
+                        if display.control[0] == 'd':
+                            display.println('Binary axis, press both corresponding buttons to assign')
+                        else:
+                            display.println('Analogue axis, move control to full extent to assign')
+                        display.println('SPACE to toggle inversion, BACKSPACE to toggle enable / disable')
 
                 try:
                     key = screen.getkey()
-                    if key in button_keys and button_keys.index(key) < len(BUTTON_NAMES):
+                    # Any key may change what's displayed, including a terminal resize
+                    drawn_version = None
+                    if key in button_by_key:
                         profiler.reset()
-                        display.control = BUTTON_NAMES[button_keys.index(key)]
-                    elif key in axis_keys and axis_keys.index(key) < len(AXIS_NAMES):
+                        display.control = button_by_key[key]
+                    elif key in axis_by_key:
                         profiler.reset()
-                        display.control = AXIS_NAMES[axis_keys.index(key)]
+                        display.control = axis_by_key[key]
                     elif key == ' ' and display.control_is_axis:
                         profile.toggle_axis_invert(name=display.control)
                     elif key == 'KEY_BACKSPACE':
@@ -148,6 +162,12 @@ class DisplayState:
         self.line = 0
         self.all_controls = [*BUTTON_NAMES, *AXIS_NAMES]
         self.control = self.all_controls[0]
+        # Reverse indices, so we don't need a linear list.index() search on each redraw or key press
+        self.axis_index = {axis: index for index, axis in enumerate(AXIS_NAMES)}
+        self.button_index = {button: index for index, button in enumerate(BUTTON_NAMES)}
+        self.control_index = {control: index for index, control in enumerate(self.all_controls)}
+        # Last rendered text for each axis, keyed by axis name, with values of (inputs, text)
+        self.axis_reprs = {}
         # Disable echo to terminal
         curses.noecho()
         # Hide the cursor
@@ -158,19 +178,22 @@ class DisplayState:
         curses.init_pair(2, curses.COLOR_BLACK, curses.COLOR_WHITE)
         # Enable colour
         curses.start_color()
+        self.contrast_attr = curses.color_pair(1)
+        self.highlight_attr = curses.color_pair(2)
         # Clear the screen
         screen.clear()
         # Enable key events for special keys i.e. arrows, backspace
         screen.keypad(True)
 
     def start(self):
-        self.screen.clear()
+        # Erase rather than clear, the refresh from the following getkey() then only redraws changed cells
+        self.screen.erase()
         self.line = 0
 
     def println(self, string, contrast=False):
         try:
             if contrast:
-                self.screen.addstr(self.line, 0, string, curses.color_pair(1))
+                self.screen.addstr(self.line, 0, string, self.contrast_attr)
             else:
                 self.screen.addstr(self.line, 0, string)
         except curses.error:
@@ -187,18 +210,18 @@ class DisplayState:
 
     @property
     def control_is_button(self):
-        return self.control in BUTTON_NAMES
+        return self.control in self.button_index
 
     @property
     def control_is_axis(self):
-        return self.control in AXIS_NAMES
+        return self.control in self.axis_index
 
     def select_next_control(self):
-        control_index = self.all_controls.index(self.control)
+        control_index = self.control_index[self.control]
         self.control = self.all_controls[(control_index + 1) % len(self.all_controls)]
 
     def select_previous_control(self):
-        control_index = self.all_controls.index(self.control)
+        control_index = self.control_index[self.control]
         self.control = self.all_controls[(control_index - 1) % len(self.all_controls)]
 
     def select_next_row(self):
@@ -209,34 +232,43 @@ class DisplayState:
         pass
 
     def show_axis(self, row, col, axis):
-        control = self.axis_keys[AXIS_NAMES.index(axis)]
+        control = self.axis_keys[self.axis_index[axis]]
+        selected = self.control == axis
+        current_value = None
+        if selected:
+            # Pick up either all changes, or binary changes only if the axis starts with 'd'
+            changes = self.profiler.axis_changes if axis[0] != 'd' else self.profiler.binary_axis_changes
+            if changes:
+                # Currently editing this axis, show live information if available
+                code, min_value, max_value, current_value = changes[0]
+                self.profile.set_axis_range(axis, code, min_value, max_value)
+        rep = self.axis_repr(axis=axis, control=control, current_value=current_value)
         try:
-            if self.control == axis:
-                # Pick up either all changes, or binary changes only if the axis starts with 'd'
-                changes = self.profiler.axis_changes if axis[0] != 'd' else self.profiler.binary_axis_changes
-                if changes:
-                    # Currently editing this axis, show live information if available
-                    code, min_value, max_value, current_value = changes[0]
-                    self.profile.set_axis_range(axis, code, min_value, max_value)
-                    rep = self.profile.axes[axis].build_repr(axis=axis, control=control, current_value=current_value)
-                else:
-                    rep = self.profile.axes[axis].build_repr(axis=axis, control=control)
-                self.screen.addstr(row, col, rep, curses.color_pair(2))
-            else:
-                self.screen.addstr(row, col, self.profile.axes[axis].build_repr(axis=axis, control=control))
+            self.screen.addstr(row, col, rep, self.highlight_attr if selected else curses.A_NORMAL)
         except curses.error:
             pass
 
+    def axis_repr(self, axis, control, current_value=None):
+        """
+        Text for an axis, only calling build_repr on the axis profile when something it displays has changed since
+        the last redraw
+        """
+        axis_profile = self.profile.axes[axis]
+        inputs = (axis_profile.code, axis_profile.invert, axis_profile.disable, current_value)
+        cached = self.axis_reprs.get(axis)
+        if cached is not None and cached[0] == inputs:
+            return cached[1]
+        rep = axis_profile.build_repr(axis=axis, control=control, current_value=current_value)
+        self.axis_reprs[axis] = inputs, rep
+        return rep
+
     def show_button(self, row, col, button):
-        control = self.button_keys[BUTTON_NAMES.index(button)]
+        control = self.button_keys[self.button_index[button]]
+        selected = self.control == button
+        if selected and self.profiler.last_button_pressed:
+            self.profile.set_button(button, self.profiler.last_button_pressed)
+        rep = f'[{control}] {button} : {self.profile.buttons[button] or "---"}'
         try:
-            if self.control == button:
-                if self.profiler.last_button_pressed:
-                    self.profile.set_button(button, self.profiler.last_button_pressed)
-                rep = f'[{control}] {button} : {self.profile.buttons[button] or "---"}'
-                self.screen.addstr(row, col, rep, curses.color_pair(2))
-            else:
-                rep = f'[{control}] {button} : {self.profile.buttons[button] or "---"}'
-                self.screen.addstr(row, col, rep)
+            self.screen.addstr(row, col, rep, self.highlight_attr if selected else curses.A_NORMAL)
         except curses.error:
             pass
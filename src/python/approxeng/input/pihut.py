@@ -1,8 +1,38 @@
+from functools import partial
+
 from approxeng.input import CentredAxis, Controller, Button, TriggerAxis, BinaryAxis
 
 __all__ = ['PiHut']
 
 
+_PIHUT_CONTROLS = (
+    partial(Button, "Select", 314, sname='select'),
+    partial(Button, "Left Stick", 317, sname='ls'),
+    partial(Button, "Right Stick", 318, sname='rs'),
+    partial(Button, "Start", 315, sname='start'),
+    partial(Button, "L1", 310, sname='l1'),
+    partial(Button, "L2", 312, sname='l2'),
+    partial(Button, "R1", 311, sname='r1'),
+    partial(Button, "R2", 313, sname='r2'),
+    partial(Button, "Triangle", 308, sname='triangle'),
+    partial(Button, "Circle", 305, sname='circle'),
+    partial(Button, "Cross", 304, sname='cross'),
+    partial(Button, "Square", 307, sname='square'),
+    partial(Button, "Analog", 316, sname='home'),
+    partial(CentredAxis, "Left Vertical", 255, 0, 1, sname='ly'),
+    partial(CentredAxis, "Right Vertical", 255, 0, 5, sname='ry'),
+    partial(CentredAxis, "Left Horizontal", 0, 255, 0, sname='lx'),
+    partial(CentredAxis, "Right Horizontal", 0, 255, 2, sname='rx'),
+    partial(TriggerAxis, "Left Trigger", 0, 255, 9, sname='lt'),
+    partial(TriggerAxis, "Right Trigger", 0, 255, 10, sname='rt'),
+    partial(BinaryAxis, "D-pad Horizontal", 16, b1name='dleft', b2name='dright'),
+    partial(BinaryAxis, "D-pad Vertical", 17, b1name='dup', b2name='ddown'),
+)
+
+
+_PIHUT_REGISTRATION_IDS = ((0x2563, 0x526), (0x2563, 0x575))
+
+
 class PiHut(Controller):
     """
     Driver for the PiHut PS3-alike controller
@@ -18,29 +48,7 @@ class PiHut(Controller):
             Used to set the hot zone for each :class:`approxeng.input.CentredAxis` in the controller.
         """
         super(PiHut, self).__init__(
-            controls=[
-                Button("Select", 314, sname='select'),
-                Button("Left Stick", 317, sname='ls'),
-                Button("Right Stick", 318, sname='rs'),
-                Button("Start", 315, sname='start'),
-                Button("L1", 310, sname='l1'),
-                Button("L2", 312, sname='l2'),
-                Button("R1", 311, sname='r1'),
-                Button("R2", 313, sname='r2'),
-                Button("Triangle", 308, sname='triangle'),
-                Button("Circle", 305, sname='circle'),
-                Button("Cross", 304, sname='cross'),
-                Button("Square", 307, sname='square'),
-                Button("Analog", 316, sname='home'),
-                CentredAxis("Left Vertical", 255, 0, 1, sname='ly'),
-                CentredAxis("Right Vertical", 255, 0, 5, sname='ry'),
-                CentredAxis("Left Horizontal", 0, 255, 0, sname='lx'),
-                CentredAxis("Right Horizontal", 0, 255, 2, sname='rx'),
-                TriggerAxis("Left Trigger", 0, 255, 9, sname='lt'),
-                TriggerAxis("Right Trigger", 0, 255, 10, sname='rt'),
-                BinaryAxis("D-pad Horizontal", 16, b1name='dleft', b2name='dright'),
-                BinaryAxis("D-pad Vertical", 17, b1name='dup', b2name='ddown')
-            ],
+            controls=[control() for control in _PIHUT_CONTROLS],
             dead_zone=dead_zone,
             hot_zone=hot_zone,
             **kwargs)
@@ -48,9 +56,9 @@ class PiHut(Controller):
     @staticmethod
     def registration_ids():
         """
-        :return: list of (vendor_id, product_id) for this controller
+        :return: tuple of (vendor_id, product_id) for this controller
         """
-        return [(0x2563, 0x526), (0x2563, 0x575)]
+        return _PIHUT_REGISTRATION_IDS
 
     def __repr__(self):
         return 'PiHut PS3-alike controller'
@@ -1,4 +1,5 @@
 from evdev import InputDevice
+from functools import partial
 from threading import Thread
 from select import select
 import logging
@@ -26,24 +27,37 @@ class Profiler:
         self.last_button_pressed = None
         self.axes = {}
         self.device = device
+        # Incremented on every change, so a display can tell whether it needs to redraw
+        self.version = 0
 
     def reset(self):
         self.last_button_pressed = None
         self.axes.clear()
+        self.version += 1
 
     def update_axis(self, code, value):
-        if code not in self.axes:
+        current = self.axes.get(code)
+        if current is None:
             self.axes[code] = value, value, value
-        min_value, max_value, _ = self.axes[code]
-        self.axes[code] = min(min_value, value), max(max_value, value), value
+        else:
+            min_value, max_value, _ = current
+            if value < min_value:
+                min_value = value
+            elif value > max_value:
+                max_value = value
+            self.axes[code] = min_value, max_value, value
+        self.version += 1
 
     def update_button(self, code):
         self.last_button_pressed = code
+        self.version += 1
 
     @property
     def axis_changes(self):
-        return sorted([(code, self.axes[code][0], self.axes[code][1], self.axes[code][2]) for code in self.axes],
-                      key=lambda item: -abs(item[1] - item[2]))
+        # Copy the items first as the profiler thread may add axes while we sort. Low never exceeds high, so sorting on
+        # low - high puts the widest observed range first without needing abs()
+        return sorted([(code, low, high, value) for code, (low, high, value) in list(self.axes.items())],
+                      key=lambda item: item[1] - item[2])
 
     @property
     def binary_axis_changes(self):
@@ -62,15 +76,20 @@ class ProfilerThread(Thread):
         self.profiler = profiler
 
     def run(self):
+        # Look these up once rather than for every event
+        devices = [self.profiler.device]
+        update_axis = self.profiler.update_axis
+        update_button = self.profiler.update_button
         while self.running:
             try:
-                r, w, x = select([self.profiler.device], [], [], 0.5)
+                r, w, x = select(devices, [], [], 0.5)
                 for fd in r:
                     for event in fd.read():
-                        if event.type == EV_ABS or event.type == EV_REL:
-                            self.profiler.update_axis(event.code, event.value)
-                        elif event.type == EV_KEY:
-                            self.profiler.update_button(event.code)
+                        event_type = event.type
+                        if event_type == EV_ABS or event_type == EV_REL:
+                            update_axis(event.code, event.value)
+                        elif event_type == EV_KEY:
+                            update_button(event.code)
             except Exception as e:
                 self.stop(e)
 
@@ -85,6 +104,8 @@ class AxisProfile:
     Details of a single axis
     """
 
+    __slots__ = ('code', 'min_value', 'max_value', 'invert', 'disable')
+
     def __init__(self, code=None, min_value=0, max_value=0, invert=False, disable=False):
         # evdev code
         self.code = code
@@ -173,11 +194,11 @@ class Profile:
         return {'vendor': self.vendor_id,
                 'product': self.product_id,
                 'name': self.name,
-                'buttons': {button: self.buttons[button] for button in self.buttons if self.buttons[button]},
-                'axes': {axis: {'code': self.axes[axis].code,
-                                'min_value': self.axes[axis].min_value,
-                                'max_value': self.axes[axis].max_value,
-                                'invert': self.axes[axis].invert} for axis in self.axes if self.axes[axis]}}
+                'buttons': {button: code for button, code in self.buttons.items() if code},
+                'axes': {name: {'code': axis.code,
+                                'min_value': axis.min_value,
+                                'max_value': axis.max_value,
+                                'invert': axis.invert} for name, axis in self.axes.items() if axis}}
 
     @dict.setter
     def dict(self, d):
@@ -197,10 +218,17 @@ class Profile:
     def controls(self):
         """
         Infers a list of control objects from the current set of known axes etc. This can be used to construct
-        a controller class
+        a controller class. Each call returns newly created control objects, as controls hold per-controller state.
+        """
+        return [factory() for factory in self._build_control_factories()]
+
+    def _build_control_factories(self):
+        """
+        Work out which controls the current profile defines, returning a tuple of functions which each create one
+        control. Creating the controls themselves is left to the caller.
         """
         # Get all buttons first, only picking up ones for which we've got known codes
-        buttons = [Button(name=name, key_code=self.buttons[name], sname=name) for name in self.buttons if
+        buttons = [partial(Button, name=name, key_code=self.buttons[name], sname=name) for name in self.buttons if
                    self.buttons[name]]
 
         # Pick up trigger axes if we have them
@@ -209,14 +237,14 @@ class Profile:
                 axis = self.axes[axis_name]
                 if self.buttons[button_name]:
                     # We have a trigger button defined, no need to include it in the trigger definition
-                    return TriggerAxis(name=axis_name, min_raw_value=axis.real_min, max_raw_value=axis.real_max,
-                                       axis_event_code=axis.code, sname=axis_name)
+                    return partial(TriggerAxis, name=axis_name, min_raw_value=axis.real_min,
+                                   max_raw_value=axis.real_max, axis_event_code=axis.code, sname=axis_name)
                 else:
                     # Have an analogue trigger but no trigger button, set the trigger axis to create a
                     # virtual button triggered at 20% activation, this is what we use for e.g. xbox controllers
-                    return TriggerAxis(name=axis_name, min_raw_value=axis.real_min, max_raw_value=axis.real_max,
-                                       axis_event_code=axis.code, sname=axis_name, button_sname=button_name,
-                                       button_trigger_value=0.2)
+                    return partial(TriggerAxis, name=axis_name, min_raw_value=axis.real_min,
+                                   max_raw_value=axis.real_max, axis_event_code=axis.code, sname=axis_name,
+                                   button_sname=button_name, button_trigger_value=0.2)
 
         triggers = [trigger_axis(a, b) for a, b in [('lt', 'l2'), ('rt', 'r2')]]
 
@@ -225,9 +253,9 @@ class Profile:
         def binary_axis(axis_name, b1name, b2name):
             if self.axes[axis_name] and self.buttons[b1name] is None and self.buttons[b2name] is None:
                 axis = self.axes[axis_name]
-                return BinaryAxis(name=axis_name, axis_event_code=axis.code,
-                                  b1name=b1name if not axis.invert else b2name,
-                                  b2name=b2name if not axis.invert else b1name)
+                return partial(BinaryAxis, name=axis_name, axis_event_code=axis.code,
+                               b1name=b1name if not axis.invert else b2name,
+                               b2name=b2name if not axis.invert else b1name)
 
         dpad = [binary_axis(a, b, c) for a, b, c in [('dx', 'dleft', 'dright'), ('dy', 'dup', 'ddown')]]
 
@@ -235,12 +263,12 @@ class Profile:
         def centred_axis(axis_name):
             if self.axes[axis_name]:
                 axis = self.axes[axis_name]
-                return CentredAxis(name=axis_name, min_raw_value=axis.real_min, max_raw_value=axis.real_max,
-                                   axis_event_code=axis.code, sname=axis_name)
+                return partial(CentredAxis, name=axis_name, min_raw_value=axis.real_min, max_raw_value=axis.real_max,
+                               axis_event_code=axis.code, sname=axis_name)
 
         sticks = [centred_axis(name) for name in ['lx', 'ly', 'rx', 'ry']]
 
-        return list([control for control in [*buttons, *triggers, *dpad, *sticks] if control is not None])
+        return tuple(factory for factory in [*buttons, *triggers, *dpad, *sticks] if factory is not None)
 
     def build_controller_class(self):
         """
@@ -249,22 +277,28 @@ class Profile:
         of the controller such as onboard LEDs, motion sensors etc. This is, however, enough for almost all
         controller types, leaving custom code only required for things like the dualshock controllers with their
         fancy touchpad surfaces and similar
+
+        The controls, ids and name are taken from the profile as it is when this is called, later changes to the
+        profile don't alter the class.
         """
-        profile = self
+        # Work out the controls once here, leaving each new controller instance to just create its own control objects
+        control_factories = self._build_control_factories()
+        registration_ids = ((self.vendor_id, self.product_id),)
+        name = self.name
 
         class ProfiledController(Controller):
 
             def __init__(self, dead_zone=0.05, hot_zone=0.05, **kwargs):
-                super(ProfiledController, self).__init__(controls=profile.controls,
+                super(ProfiledController, self).__init__(controls=[factory() for factory in control_factories],
                                                          dead_zone=dead_zone,
                                                          hot_zone=hot_zone,
                                                          **kwargs)
 
             @staticmethod
             def registration_ids():
-                return [(profile.vendor_id, profile.product_id)]
+                return registration_ids
 
             def __repr__(self) -> str:
-                return profile.name
+                return name
 
         return ProfiledController
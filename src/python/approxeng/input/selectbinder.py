@@ -1,6 +1,7 @@
-from functools import reduce
-from select import select
-from threading import Thread
+import os
+from itertools import chain
+from selectors import DefaultSelector, EVENT_READ
+from threading import Thread, Lock
 
 import approxeng.input.sys as sys
 from approxeng.input.controllers import *
@@ -9,6 +10,9 @@ EV_KEY = 1
 EV_REL = 2
 EV_ABS = 3
 
+# Event types which are routed to the controller's axes
+AXIS_EVENT_TYPES = frozenset((EV_ABS, EV_REL))
+
 
 class ControllerResource:
     """
@@ -70,68 +74,107 @@ def bind_controllers(*discoveries, print_events=False):
 
     discoveries = list(discoveries)
 
+    # Decide once whether events are echoed, rather than checking print_events for every event read
+    if print_events:
+        def read_events(device):
+            for event in device.read():
+                print(event)
+                yield event
+    else:
+        def read_events(device):
+            return device.read()
+
     class SelectThread(Thread):
         def __init__(self):
             Thread.__init__(self, name='evdev select thread')
             self.daemon = True
             self.running = True
 
-            self.device_to_controller_discovery = {}
+            self.all_devices = list(chain.from_iterable(discovery.devices for discovery in discoveries))
+            # Controllers paired with their device unique names, for run() and stop() to update
+            self.controllers = [(discovery.controller, discovery.name) for discovery in discoveries]
+
+            # Register the device nodes once with the platform's best selector (epoll on Linux). Each registration
+            # carries everything needed to handle that device's events: the prefix for event codes when the controller
+            # spans several device nodes, the controller's bound method for axis events, and its button handlers keyed
+            # by EV_KEY event value. Only press (1) and release (0) have handlers, autorepeat (2) events are ignored
+            self.selector = DefaultSelector()
             for discovery in discoveries:
+                controller = discovery.controller
                 for d in discovery.devices:
-                    self.device_to_controller_discovery[d.fn] = discovery
-            self.all_devices = reduce(lambda x, y: x + y, [discovery.devices for discovery in discoveries])
+                    prefix = None
+                    if controller.node_mappings is not None and len(discovery.devices) > 1:
+                        prefix = controller.node_mappings.get(d.name)
+                    self.selector.register(d, EVENT_READ, data=(prefix, controller.axes.axis_updated,
+                                                                {1: controller.buttons.button_pressed,
+                                                                 0: controller.buttons.button_released}))
+
+            # Pipe written to by stop(), so the thread can block in select until there's an event or it's told to stop,
+            # rather than waking periodically to check whether it's still running. Registered without data, which is
+            # how the run loop tells it apart from the devices. The lock ensures only the first stop() writes to it.
+            self.wake_read, self.wake_write = os.pipe()
+            self.selector.register(self.wake_read, EVENT_READ)
+            self.stop_lock = Lock()
 
         def run(self):
 
-            for discovery in discoveries:
-                discovery.controller.device_unique_name = discovery.name
+            for controller, name in self.controllers:
+                controller.device_unique_name = name
 
             while self.running:
                 try:
-                    r, w, x = select(self.all_devices, [], [], 0.5)
-                    for fd in r:
-                        active_device = fd
-                        controller_discovery = self.device_to_controller_discovery[active_device.fn]
-                        controller = controller_discovery.controller
-                        controller_devices = controller_discovery.devices
-                        prefix = None
-                        if controller.node_mappings is not None and len(controller_devices) > 1:
-                            try:
-                                prefix = controller.node_mappings[active_device.name]
-                            except KeyError:
-                                pass
-                        for event in active_device.read():
-                            if print_events:
-                                print(event)
-                            if event.type == EV_ABS or event.type == EV_REL:
-                                controller.axes.axis_updated(event, prefix=prefix)
-                            elif event.type == EV_KEY:
-                                # Button event
-                                if event.value == 1:
-                                    # Button down
-                                    controller.buttons.button_pressed(event.code, prefix=prefix)
-                                elif event.value == 0:
-                                    # Button up
-                                    controller.buttons.button_released(event.code, prefix=prefix)
+                    for key, _ in self.selector.select():
+                        if key.data is None:
+                            # Woken by stop(), self.running is now False
+                            continue
+                        active_device = key.fileobj
+                        prefix, axis_updated, button_handlers = key.data
+                        for event in read_events(active_device):
+                            event_type = event.type
+                            if event_type in AXIS_EVENT_TYPES:
+                                axis_updated(event, prefix=prefix)
+                            elif event_type == EV_KEY:
+                                # Button event, dispatch on value to button down or up
+                                button_handler = button_handlers.get(event.value)
+                                if button_handler is not None:
+                                    button_handler(event.code, prefix=prefix)
                 except Exception as e:
                     self.stop(e)
 
+            self.close()
+
+        def close(self):
+            """
+            Release the selector and wake pipe, called when the thread finishes, or in place of running it if binding
+            fails
+            """
+            self.selector.close()
+            with self.stop_lock:
+                # Make any later stop() a no-op rather than a write to the closed pipe
+                self.running = False
+                os.close(self.wake_read)
+                os.close(self.wake_write)
+
         def stop(self, exception=None):
 
-            for discovery in discoveries:
-                discovery.controller.device_unique_name = None
-                discovery.controller.exception = exception
+            for controller, _ in self.controllers:
+                controller.device_unique_name = None
+                controller.exception = exception
 
-            self.running = False
+            with self.stop_lock:
+                if self.running:
+                    self.running = False
+                    os.write(self.wake_write, b'\0')
 
     polling_thread = SelectThread()
 
-    # Force an update of the LED and battery system cache
-    sys.scan_cache(force_update=True)
-
-    for device in polling_thread.all_devices:
-        device.grab()
+    try:
+        for device in polling_thread.all_devices:
+            device.grab()
+    except Exception:
+        # The thread will never run, so release what it set up before passing the error on
+        polling_thread.close()
+        raise
 
     def unbind():
         polling_thread.stop()
@@ -143,4 +186,8 @@ def bind_controllers(*discoveries, print_events=False):
 
     polling_thread.start()
 
+    # Discard any cached LED and battery scan, as it won't include newly connected controllers. The sysfs walk is then
+    # only done, once, if something actually reads or writes an LED or the battery level, so binding isn't held up by it
+    sys.invalidate_cache()
+
     return unbind
@@ -1,8 +1,38 @@
+from functools import partial
+
 from approxeng.input import Controller, Button, CentredAxis, TriggerAxis, BinaryAxis
 
 __all__ = ['SF30Pro']
 
 
+_SF30PRO_CONTROLS = (
+    partial(TriggerAxis, "Right Trigger", 0, 255, 9, sname='rt'),
+    partial(TriggerAxis, "Left Trigger", 0, 255, 10, sname='lt'),
+    partial(CentredAxis, "Right Vertical", 255, 0, 5, sname='ry'),
+    partial(CentredAxis, "Left Horizontal", 0, 255, 0, sname='lx'),
+    partial(CentredAxis, "Left Vertical", 255, 0, 1, sname='ly'),
+    partial(CentredAxis, "Right Horizontal", 0, 255, 2, sname='rx'),
+    partial(BinaryAxis, "D-pad Horizontal", 16, b1name='dleft', b2name='dright'),
+    partial(BinaryAxis, "D-pad Vertical", 17, b1name='ddown', b2name='dup'),
+    partial(Button, "B", 304, sname='circle'),
+    partial(Button, "A", 305, sname='cross'),
+    partial(Button, "Mode", 306, sname='home'),
+    partial(Button, "X", 307, sname='triangle'),
+    partial(Button, "Y", 308, sname='square'),
+    partial(Button, "L1", 310, sname='l1'),
+    partial(Button, "R1", 311, sname='r1'),
+    partial(Button, "L2", 312, sname='l2'),
+    partial(Button, "R2", 313, sname='r2'),
+    partial(Button, "Select", 314, sname='select'),
+    partial(Button, "Start", 315, sname='start'),
+    partial(Button, "Left Stick", 317, sname='ls'),
+    partial(Button, "Right Stick", 318, sname='rs'),
+)
+
+
+_SF30PRO_REGISTRATION_IDS = ((0x2dc8, 0x6100),)
+
+
 class SF30Pro(Controller):
     """
     Driver for the 8BitDo SF30 Pro, courtesy of Tom Brougthon (tabroughton on github)
@@ -18,29 +48,7 @@ class SF30Pro(Controller):
             Used to set the hot zone for each :class:`approxeng.input.CentredAxis` in the controller.
         """
         super(SF30Pro, self).__init__(
-            controls=[
-                TriggerAxis("Right Trigger", 0, 255, 9, sname='rt'),
-                TriggerAxis("Left Trigger", 0, 255, 10, sname='lt'),
-                CentredAxis("Right Vertical", 255, 0, 5, sname='ry'),
-                CentredAxis("Left Horizontal", 0, 255, 0, sname='lx'),
-                CentredAxis("Left Vertical", 255, 0, 1, sname='ly'),
-                CentredAxis("Right Horizontal", 0, 255, 2, sname='rx'),
-                BinaryAxis("D-pad Horizontal", 16, b1name='dleft', b2name='dright'),
-                BinaryAxis("D-pad Vertical", 17, b1name='ddown', b2name='dup'),
-                Button("B", 304, sname='circle'),
-                Button("A", 305, sname='cross'),
-                Button("Mode", 306, sname='home'),
-                Button("X", 307, sname='triangle'),
-                Button("Y", 308, sname='square'),
-                Button("L1", 310, sname='l1'),
-                Button("R1", 311, sname='r1'),
-                Button("L2", 312, sname='l2'),
-                Button("R2", 313, sname='r2'),
-                Button("Select", 314, sname='select'),
-                Button("Start", 315, sname='start'),
-                Button("Left Stick", 317, sname='ls'),
-                Button("Right Stick", 318, sname='rs')
-            ],
+            controls=[control() for control in _SF30PRO_CONTROLS],
             dead_zone=dead_zone,
             hot_zone=hot_zone,
             **kwargs)
@@ -48,9 +56,9 @@ class SF30Pro(Controller):
     @staticmethod
     def registration_ids():
         """
-        :return: list of (vendor_id, product_id) for this controller
+        :return: tuple of (vendor_id, product_id) for this controller
         """
-        return [(0x2dc8, 0x6100)]
+        return _SF30PRO_REGISTRATION_IDS
 
     def __repr__(self):
         return '8Bitdo SF30 Pro'
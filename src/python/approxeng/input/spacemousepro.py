@@ -1,8 +1,38 @@
+from functools import partial
+
 from approxeng.input import Controller, CentredAxis, Button
 
 __all__ = ['SpaceMousePro']
 
 
+_SPACEMOUSE_CONTROLS = (
+    partial(CentredAxis, 'X', -350, 350, 0, sname='lx'),
+    partial(CentredAxis, 'Y', 350, -350, 1, sname='ly'),
+    partial(CentredAxis, 'Z', 350, -350, 2, sname='lz'),
+    partial(CentredAxis, 'Roll', -350, 350, 3, sname='pitch'),
+    partial(CentredAxis, 'Pitch', 350, -350, 4, sname='roll'),
+    partial(CentredAxis, 'Yaw', -350, 350, 5, sname='yaw'),
+    partial(Button, 'Menu', 256, sname='menu'),
+    partial(Button, 'Alt', 279, sname='alt'),
+    partial(Button, 'Ctrl', 281, sname='ctrl'),
+    partial(Button, 'Shift', 280, sname='shift'),
+    partial(Button, 'Esc', 278, sname='esc'),
+    partial(Button, '1', 268, sname='1'),
+    partial(Button, '2', 269, sname='2'),
+    partial(Button, '3', 270, sname='3'),
+    partial(Button, '4', 271, sname='4'),
+    partial(Button, 'Rotate', 264, sname='rotate'),
+    partial(Button, 'T', 258, sname='t'),
+    partial(Button, 'F', 261, sname='f'),
+    partial(Button, 'R', 260, sname='r'),
+    partial(Button, 'Lock', 282, sname='lock'),
+    partial(Button, 'Fit', 257, sname='fit'),
+)
+
+
+_SPACEMOUSE_REGISTRATION_IDS = ((0x46d, 0xc62b),)
+
+
 class SpaceMousePro(Controller):
     """
     Driver for the wired SpaceMouse Pro from 3dConnexion. This controller has a single six-axis puck which can respond
@@ -20,29 +50,7 @@ class SpaceMousePro(Controller):
     """
 
     def __init__(self, dead_zone=0.05, hot_zone=0.01, **kwargs):
-        super(SpaceMousePro, self).__init__(controls=[
-            CentredAxis('X', -350, 350, 0, sname='lx'),
-            CentredAxis('Y', 350, -350, 1, sname='ly'),
-            CentredAxis('Z', 350, -350, 2, sname='lz'),
-            CentredAxis('Roll', -350, 350, 3, sname='pitch'),
-            CentredAxis('Pitch', 350, -350, 4, sname='roll'),
-            CentredAxis('Yaw', -350, 350, 5, sname='yaw'),
-            Button('Menu', 256, sname='menu'),
-            Button('Alt', 279, sname='alt'),
-            Button('Ctrl', 281, sname='ctrl'),
-            Button('Shift', 280, sname='shift'),
-            Button('Esc', 278, sname='esc'),
-            Button('1', 268, sname='1'),
-            Button('2', 269, sname='2'),
-            Button('3', 270, sname='3'),
-            Button('4', 271, sname='4'),
-            Button('Rotate', 264, sname='rotate'),
-            Button('T', 258, sname='t'),
-            Button('F', 261, sname='f'),
-            Button('R', 260, sname='r'),
-            Button('Lock', 282, sname='lock'),
-            Button('Fit', 257, sname='fit')
-        ],
+        super(SpaceMousePro, self).__init__(controls=[control() for control in _SPACEMOUSE_CONTROLS],
             dead_zone=dead_zone,
             hot_zone=hot_zone,
             **kwargs)
@@ -53,6 +61,6 @@ class SpaceMousePro(Controller):
     @staticmethod
     def registration_ids():
         """
-        :return: list of (vendor_id, product_id) for this controller
+        :return: tuple of (vendor_id, product_id) for this controller
         """
-        return [(0x46d, 0xc62b)]
+        return _SPACEMOUSE_REGISTRATION_IDS
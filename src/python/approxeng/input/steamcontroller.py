@@ -1,8 +1,46 @@
+from functools import partial
+
 from approxeng.input import CentredAxis, TriggerAxis, Button, Controller, BinaryAxis
 
 __all__ = ['SteamController']
 
 
+_STEAM_CONTROLS = (
+    partial(Button, "X", 307, sname='square'),
+    partial(Button, "Y", 308, sname='triangle'),
+    partial(Button, "B", 305, sname='circle'),
+    partial(Button, "A", 304, sname='cross'),
+    partial(Button, "Left", 314, sname='select'),
+    partial(Button, "Right", 315, sname='start'),
+    partial(Button, "Steam", 316, sname='home'),
+    partial(Button, "Left Stick Click", 317, sname='ls'),
+    partial(Button, "Right Trackpad Click", 318, sname='rs'),
+    partial(Button, "Right Trackpad Touch", 290, sname='rtouch'),
+    partial(Button, "Left Trackpad Touch", 289, sname='dtouch'),
+    partial(Button, 'Top Left Trigger', 310, sname='l1'),
+    partial(Button, 'Mid Left Trigger', 312, sname='l2'),
+    partial(Button, 'Bottom Left Trigger', 336, sname='l3'),
+    partial(Button, 'Top Right Trigger', 311, sname='r1'),
+    partial(Button, 'Mid Right Trigger', 313, sname='r2'),
+    partial(Button, 'Bottom Right Trigger', 337, sname='r3'),
+    partial(Button, 'D-pad left', 546, sname='dleft'),
+    partial(Button, 'D-pad right', 547, sname='dright'),
+    partial(Button, 'D-pad up', 544, sname='dup'),
+    partial(Button, 'D-pad down', 545, sname='ddown'),
+    partial(CentredAxis, "Left Stick Horizontal", -32768, 32768, 0, sname='lx'),
+    partial(CentredAxis, "Left Stick Vertical", 32768, -32768, 1, sname='ly'),
+    partial(CentredAxis, "Right Trackpad Horizontal", -32768, 32768, 3, sname='rx'),
+    partial(CentredAxis, "Right Trackpad Vertical", 32768, -32768, 4, sname='ry'),
+    partial(CentredAxis, "Left Trackpad Horizontal", -32768, 32768, 16, sname='dx'),
+    partial(CentredAxis, "Left Trackpad Vertical", 32768, -32768, 17, sname='dy'),
+    partial(TriggerAxis, "Left Trigger", 0, 255, 21, sname='lt'),
+    partial(TriggerAxis, "Right Trigger", 0, 255, 20, sname='rt'),
+)
+
+
+_STEAM_REGISTRATION_IDS = ((10462, 4418),)
+
+
 class SteamController(Controller):
     """
     Wireless steam controller. As of Jan 2021 this works with modern linux installations without
@@ -58,44 +96,17 @@ class SteamController(Controller):
 
     def __init__(self, dead_zone=0.1, hot_zone=0.05, **kwargs):
         super(SteamController, self).__init__(
-            controls=[
-                Button("X", 307, sname='square'),
-                Button("Y", 308, sname='triangle'),
-                Button("B", 305, sname='circle'),
-                Button("A", 304, sname='cross'),
-                Button("Left", 314, sname='select'),
-                Button("Right", 315, sname='start'),
-                Button("Steam", 316, sname='home'),
-                Button("Left Stick Click", 317, sname='ls'),
-                Button("Right Trackpad Click", 318, sname='rs'),
-                Button("Right Trackpad Touch", 290, sname='rtouch'),
-                Button("Left Trackpad Touch", 289, sname='dtouch'),
-                Button('Top Left Trigger', 310, sname='l1'),
-                Button('Mid Left Trigger', 312, sname='l2'),
-                Button('Bottom Left Trigger', 336, sname='l3'),
-                Button('Top Right Trigger', 311, sname='r1'),
-                Button('Mid Right Trigger', 313, sname='r2'),
-                Button('Bottom Right Trigger', 337, sname='r3'),
-                Button('D-pad left', 546, sname='dleft'),
-                Button('D-pad right', 547, sname='dright'),
-                Button('D-pad up', 544, sname='dup'),
-                Button('D-pad down', 545, sname='ddown'),
-                CentredAxis("Left Stick Horizontal", -32768, 32768, 0, sname='lx'),
-                CentredAxis("Left Stick Vertical", 32768, -32768, 1, sname='ly'),
-                CentredAxis("Right Trackpad Horizontal", -32768, 32768, 3, sname='rx'),
-                CentredAxis("Right Trackpad Vertical", 32768, -32768, 4, sname='ry'),
-                CentredAxis("Left Trackpad Horizontal", -32768, 32768, 16, sname='dx'),
-                CentredAxis("Left Trackpad Vertical", 32768, -32768, 17, sname='dy'),
-                TriggerAxis("Left Trigger", 0, 255, 21, sname='lt'),
-                TriggerAxis("Right Trigger", 0, 255, 20, sname='rt')
-            ],
+            controls=[control() for control in _STEAM_CONTROLS],
             dead_zone=dead_zone,
             hot_zone=hot_zone,
             **kwargs)
 
     @staticmethod
     def registration_ids():
-        return [(10462, 4418)]
+        """
+        :return: tuple of (vendor_id, product_id) for this controller
+        """
+        return _STEAM_REGISTRATION_IDS
 
     def __repr__(self):
         return 'Valve Steam Controller'
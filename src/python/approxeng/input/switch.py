@@ -1,8 +1,44 @@
+from functools import partial
+
 from approxeng.input import Controller, Button, CentredAxis
 
 __all__ = ['SwitchJoyConLeft', 'SwitchJoyConRight']
 
 
+# The shoulder buttons and stick are the same on both JoyCons when held sideways, so these are defined once and added
+# to each.
+_JOYCON_COMMON_CONTROLS = (
+    partial(Button, "SL", 308, sname="l1"),
+    partial(Button, "SR", 309, sname="r1"),
+    partial(CentredAxis, "Left Horizontal", -1, 1, 16, sname="lx"),
+    partial(CentredAxis, "Left Vertical", 1, -1, 17, sname="ly"),
+)
+
+_JOYCON_LEFT_CONTROLS = (
+    partial(Button, "Right", 305, sname="circle"),
+    partial(Button, "Up", 307, sname="triangle"),
+    partial(Button, "Left", 306, sname="square"),
+    partial(Button, "Down", 304, sname="cross"),
+    partial(Button, "Left Stick", 314, sname="ls"),
+    partial(Button, "Home", 317, sname="home"),
+    partial(Button, "Minus", 312, sname="start"),
+) + _JOYCON_COMMON_CONTROLS
+
+_JOYCON_LEFT_REGISTRATION_IDS = ((0x57e, 0x2006),)
+
+_JOYCON_RIGHT_CONTROLS = (
+    partial(Button, "X", 305, sname="circle"),
+    partial(Button, "Y", 307, sname="triangle"),
+    partial(Button, "B", 306, sname="square"),
+    partial(Button, "A", 304, sname="cross"),
+    partial(Button, "Left Stick", 315, sname="ls"),
+    partial(Button, "Home", 316, sname="home"),
+    partial(Button, "Plus", 313, sname="start"),
+) + _JOYCON_COMMON_CONTROLS
+
+_JOYCON_RIGHT_REGISTRATION_IDS = ((0x57e, 0x2007),)
+
+
 class SwitchJoyConLeft(Controller):
     """
     Nintendo Switch Joycon controller, curently only the Left Controller
@@ -24,20 +60,7 @@ class SwitchJoyConLeft(Controller):
             :class:`approxeng.input.TriggerAxis` in the controller.
         """
         super(SwitchJoyConLeft, self).__init__(
-            controls=[
-                Button("Right", 305, sname="circle"),
-                Button("Up", 307, sname="triangle"),
-                Button("Left", 306, sname="square"),
-                Button("Down", 304, sname="cross"),
-                Button("Left Stick", 314, sname="ls"),
-                Button("Home", 317, sname="home"),
-                Button("Minus", 312, sname="start"),
-                Button("SL", 308, sname="l1"),
-                Button("SR", 309, sname="r1"),
-                CentredAxis("Left Horizontal", -1, 1, 16, sname="lx"),
-                CentredAxis("Left Vertical", 1, -1, 17, sname="ly")
-
-            ],
+            controls=[control() for control in _JOYCON_LEFT_CONTROLS],
             dead_zone=dead_zone,
             hot_zone=hot_zone,
             **kwargs)
@@ -45,9 +68,9 @@ class SwitchJoyConLeft(Controller):
     @staticmethod
     def registration_ids():
         """
-        :return: list of (vendor_id, product_id) for this controller
+        :return: tuple of (vendor_id, product_id) for this controller
         """
-        return [(0x57e, 0x2006)]
+        return _JOYCON_LEFT_REGISTRATION_IDS
 
     def __repr__(self):
         return 'Nintendo Switch JoyCon controller (Left)'
@@ -72,19 +95,7 @@ class SwitchJoyConRight(Controller):
             :class:`approxeng.input.TriggerAxis` in the controller.
         """
         super(SwitchJoyConRight, self).__init__(
-            controls=[
-                Button("X", 305, sname="circle"),
-                Button("Y", 307, sname="triangle"),
-                Button("B", 306, sname="square"),
-                Button("A", 304, sname="cross"),
-                Button("Left Stick", 315, sname="ls"),
-                Button("Home", 316, sname="home"),
-                Button("Plus", 313, sname="start"),
-                Button("SL", 308, sname="l1"),
-                Button("SR", 309, sname="r1"),
-                CentredAxis("Left Horizontal", -1, 1, 16, sname="lx"),
-                CentredAxis("Left Vertical", 1, -1, 17, sname="ly")
-            ],
+            controls=[control() for control in _JOYCON_RIGHT_CONTROLS],
             dead_zone=dead_zone,
             hot_zone=hot_zone,
             **kwargs)
@@ -92,9 +103,9 @@ class SwitchJoyConRight(Controller):
     @staticmethod
     def registration_ids():
         """
-        :return: list of (vendor_id, product_id) for this controller
+        :return: tuple of (vendor_id, product_id) for this controller
         """
-        return [(0x57e, 0x2007)]
+        return _JOYCON_RIGHT_REGISTRATION_IDS
 
     def __repr__(self):
         return 'Nintendo Switch JoyCon controller (Right)'
@@ -1,11 +1,32 @@
+import atexit
+import io
 import logging
-from os import listdir
+import os
+import re
+from threading import Lock
 from typing import Optional
 
 logger = logging.getLogger(name='approxeng.input.sys')
 
 __CACHED_SCAN__: Optional[dict] = None
 
+# Held while scanning or discarding the cached scan, so threads racing to use LEDs or batteries only do one scan between
+# them
+__SCAN_LOCK__ = Lock()
+
+# File descriptors for LED brightness and battery capacity files, keyed on (path, open flags). These are opened on first
+# use and then held, so repeated LED updates or reads are a single system call, and closed when the scan the paths came
+# from is replaced, or at exit. Reads and writes of the same LED use separate descriptors, as brightness files are often
+# readable by users who can't write them.
+__HELD_FDS__: dict = {}
+
+# Held across looking up or opening a descriptor and the read or write through it, and while closing descriptors, so
+# a rescan from another thread can't close a descriptor, or let its number be reused, while it's in use
+__HELD_FDS_LOCK__ = Lock()
+
+# Matches the HID_UNIQ and PHYS lines in a uevent file, these are the only ones we use to find hardware IDs
+_UEVENT_ID_PATTERN = re.compile(rb'^(HID_UNIQ|PHYS)=([^=\n]*)$', re.MULTILINE)
+
 
 def scan_cache(force_update=False):
     """
@@ -19,16 +40,95 @@ def scan_cache(force_update=False):
     """
 
     global __CACHED_SCAN__
-    if force_update or __CACHED_SCAN__ is None:
-        __CACHED_SCAN__ = scan_system()
-    return __CACHED_SCAN__
+    scan = __CACHED_SCAN__
+    if scan is not None and not force_update:
+        return scan
+    with __SCAN_LOCK__:
+        # Another thread may have completed a scan while we were waiting for the lock
+        if force_update or __CACHED_SCAN__ is None:
+            close_held_fds()
+            __CACHED_SCAN__ = scan_system()
+        return __CACHED_SCAN__
+
+
+def invalidate_cache():
+    """
+    Discard any cached scan, so the next LED or power access performs a new one. This is much cheaper than forcing
+    a scan when it's not known whether LEDs or power levels will actually be used.
+    """
+    global __CACHED_SCAN__
+    with __SCAN_LOCK__:
+        close_held_fds()
+        __CACHED_SCAN__ = None
+
+
+@atexit.register
+def close_held_fds():
+    """
+    Close any LED or battery files held open by previous accesses. They'll be re-opened if needed.
+    """
+    with __HELD_FDS_LOCK__:
+        for fd in __HELD_FDS__.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        __HELD_FDS__.clear()
+
+
+def _held_fd(path, flags):
+    """
+    Get the held file descriptor for a path, opening it with the supplied flags if we don't already have one. Access to
+    sysfs attributes is always from the start of the file, so the same descriptor can be used repeatedly with pread and
+    pwrite at offset 0. Must be called with __HELD_FDS_LOCK__ held, and the descriptor only used while it still is.
+    """
+    fd = __HELD_FDS__.get((path, flags))
+    if fd is None:
+        fd = os.open(path, flags)
+        __HELD_FDS__[path, flags] = fd
+    return fd
+
+
+def _drop_held_fd(path, flags):
+    """
+    Close and forget the held file descriptor for a path and flags, used when access fails, most likely because the
+    device has gone away, so the next access tries to open the path again. Must be called with __HELD_FDS_LOCK__ held.
+    """
+    fd = __HELD_FDS__.pop((path, flags), None)
+    if fd is not None:
+        os.close(fd)
+
+
+def _write_led(path, value):
+    """
+    Write a value to an LED brightness file through a held file descriptor
+    """
+    with __HELD_FDS_LOCK__:
+        try:
+            os.pwrite(_held_fd(path, os.O_WRONLY), b'%d' % int(value), 0)
+        except OSError:
+            _drop_held_fd(path, os.O_WRONLY)
+            raise
+
+
+def _read_held(path):
+    """
+    Read the contents of a small sysfs file, such as an LED brightness or battery capacity, through a held file
+    descriptor
+    """
+    with __HELD_FDS_LOCK__:
+        try:
+            return os.pread(_held_fd(path, os.O_RDONLY), 16, 0)
+        except OSError:
+            _drop_held_fd(path, os.O_RDONLY)
+            raise
 
 
 def read_led_value(hw_id, led_name) -> int:
-    if hw_id in __CACHED_SCAN__['leds']:
-        if led_name in __CACHED_SCAN__['leds'][hw_id]:
-            with open(__CACHED_SCAN__['leds'][hw_id][led_name], 'r') as f:
-                return int(f.read() or None)
+    scan = scan_cache()
+    if hw_id in scan['leds']:
+        if led_name in scan['leds'][hw_id]:
+            return int(_read_held(scan['leds'][hw_id][led_name]) or None)
         else:
             logger.debug("No led called {} in {}".format(led_name, hw_id))
     else:
@@ -36,16 +136,36 @@ def read_led_value(hw_id, led_name) -> int:
 
 
 def write_led_value(hw_id, led_name, value):
-    if hw_id in __CACHED_SCAN__['leds']:
-        if led_name in __CACHED_SCAN__['leds'][hw_id]:
-            with open(__CACHED_SCAN__['leds'][hw_id][led_name], 'w') as f:
-                f.write(str(int(value)))
+    scan = scan_cache()
+    if hw_id in scan['leds']:
+        if led_name in scan['leds'][hw_id]:
+            _write_led(scan['leds'][hw_id][led_name], value)
         else:
             logger.debug("No led called {} in {}".format(led_name, hw_id))
     else:
         logger.debug("No hardware ID {} in scan".format(hw_id))
 
 
+def write_led_values(hw_id, led_values: dict):
+    """
+    Write values to several LEDs on the same device, resolving the device's LEDs once rather than once per LED.
+
+    :param hw_id:
+        Unique hardware ID
+    :param led_values:
+        Dict of LED name to the value to write to that LED
+    """
+    leds = scan_cache()['leds'].get(hw_id)
+    if leds is None:
+        logger.debug("No hardware ID {} in scan".format(hw_id))
+        return
+    for led_name, value in led_values.items():
+        if led_name in leds:
+            _write_led(leds[led_name], value)
+        else:
+            logger.debug("No led called {} in {}".format(led_name, hw_id))
+
+
 def read_power_level(hw_id) -> Optional[float]:
     """
     Power level as a percentage, or None if the device doesn't have a corresponding /sys/power_supply node
@@ -55,11 +175,10 @@ def read_power_level(hw_id) -> Optional[float]:
     :return:
         Float 0.0-100.0 percentage of battery capacity, or None if no battery found.
     """
-    if hw_id in __CACHED_SCAN__['power']:
-        with open(__CACHED_SCAN__['power'][hw_id], 'r') as f:
-            return float(f.read() or 0) / 100.0
-    else:
+    path = scan_cache()['power'].get(hw_id)
+    if path is None:
         return None
+    return float(_read_held(path) or 0) / 100.0
 
 
 def sys_nodes(hw_id):
@@ -73,14 +192,53 @@ def sys_nodes(hw_id):
         Dict containing either nothing, or one or both of 'leds' and 'power' keys. Power is a single file path, LEDs
         a dict from LED name to file path.
     """
+    scan = scan_cache()
     info = {}
-    if hw_id in __CACHED_SCAN__['power']:
-        info['power'] = __CACHED_SCAN__['power'][hw_id]
-    if hw_id in __CACHED_SCAN__['leds']:
-        info['leds'] = {name: __CACHED_SCAN__['leds'][hw_id][name] for name in __CACHED_SCAN__['leds'][hw_id]}
+    if hw_id in scan['power']:
+        info['power'] = scan['power'][hw_id]
+    if hw_id in scan['leds']:
+        info['leds'] = {name: scan['leds'][hw_id][name] for name in scan['leds'][hw_id]}
     return info
 
 
+def _parse_hardware_id(uevent: bytes) -> Optional[str]:
+    """
+    Pick the hardware ID out of the contents of a uevent file, preferring HID_UNIQ and falling back to the first part
+    of PHYS.
+
+    :param uevent:
+        Raw contents of the uevent file
+    :return:
+        The hardware ID, or None if the file has neither a HID_UNIQ nor a PHYS value
+    """
+    hid_uniq = None
+    phys = None
+    for name, value in _UEVENT_ID_PATTERN.findall(uevent):
+        value = value.replace(b'"', b'')
+        if name == b'HID_UNIQ' and value:
+            hid_uniq = value
+        elif name == b'PHYS' and value:
+            phys = value.partition(b'/')[0]
+    if hid_uniq:
+        return hid_uniq.decode()
+    elif phys:
+        return phys.decode()
+    return None
+
+
+def _find_device_hardware_id(uevent_file_path) -> Optional[str]:
+    """
+    Read a uevent file and find its hardware ID, returning None if the file doesn't exist
+    """
+    try:
+        # Unbuffered, the whole file is read in one go so a buffering layer would only add overhead
+        with io.FileIO(uevent_file_path, 'rb') as f:
+            uevent = f.readall()
+    except FileNotFoundError:
+        return None
+    return _parse_hardware_id(uevent)
+
+
 def scan_system():
     """
     Scans /sys/class/leds looking for entries, then examining their .../device/uevent file to obtain unique hardware
@@ -101,45 +259,43 @@ def scan_system():
         A dict containing available LEDs, keyed on physical device ID
     """
 
-    def find_device_hardware_id(uevent_file_path):
+    # Hardware IDs found so far in this scan, keyed on the device's (st_dev, st_ino). Several LEDs, and the battery, of a
+    # controller usually share the same parent device, so this only reads and parses each device's uevent file once
+    hardware_ids = {}
+
+    def class_entry_hardware_id(entry_path):
         try:
-            hid_uniq = None
-            phys = None
-            for line in open(uevent_file_path, 'r').read().split('\n'):
-                parts = line.split('=')
-                if len(parts) == 2:
-                    name, value = parts
-                    value = value.replace('"', '')
-                    if name == 'HID_UNIQ' and value:
-                        hid_uniq = value
-                    elif name == 'PHYS' and value:
-                        phys = value.split('/')[0]
-            if hid_uniq:
-                return hid_uniq
-            elif phys:
-                return phys
+            device_stat = os.stat(f'{entry_path}/device')
         except FileNotFoundError:
-            pass
-        return None
+            return None
+        key = device_stat.st_dev, device_stat.st_ino
+        if key not in hardware_ids:
+            hardware_ids[key] = _find_device_hardware_id(f'{entry_path}/device/uevent')
+        return hardware_ids[key]
+
+    def class_entries(class_path):
+        # Systems without any LEDs or power supplies may not have the class directory at all, treat that as empty
+        try:
+            with os.scandir(class_path) as entries:
+                yield from entries
+        except FileNotFoundError:
+            logger.debug("No {} directory, skipping".format(class_path))
 
     leds = {}
-    for sub in ['/sys/class/leds/' + sub_dir for sub_dir in listdir('/sys/class/leds')]:
-        led_name = sub.split(':')[-1]
-        write_path = sub + '/brightness'
-        device_id = find_device_hardware_id(sub + '/device/uevent')
+    for entry in class_entries('/sys/class/leds'):
+        device_id = class_entry_hardware_id(entry.path)
         if device_id:
             if device_id not in leds:
                 leds[device_id] = {}
-            leds[device_id][led_name] = write_path
+            leds[device_id][entry.name.rpartition(':')[2]] = f'{entry.path}/brightness'
 
     power = {}
-    for sub in ['/sys/class/power_supply/' + sub_dir for sub_dir in listdir('/sys/class/power_supply')]:
+    for entry in class_entries('/sys/class/power_supply'):
         # From https://www.kernel.org/doc/Documentation/power/power_supply_class.txt - this is the
         # capacity as a percentage, so will always be an integer in the range 0-100
-        read_path = sub + '/capacity'
-        device_id = find_device_hardware_id(sub + '/device/uevent')
+        device_id = class_entry_hardware_id(entry.path)
         if device_id:
-            power[device_id] = read_path
+            power[device_id] = f'{entry.path}/capacity'
 
     return {'leds': leds,
             'power': power}
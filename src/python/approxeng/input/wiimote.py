@@ -1,8 +1,43 @@
+from functools import partial
+
 from approxeng.input import Controller, Button, CentredAxis
 
 __all__ = ['WiiMote']
 
 
+_WIIMOTE_CONTROLS = (
+    partial(Button, "Nunchuck Z", 309, sname="r1"),
+    partial(Button, "Nunchuck C", 306, sname="r2"),
+    partial(Button, "Wiimote A", 304, sname="cross"),
+    partial(Button, "Wiimote B", 305, sname="circle"),
+    partial(Button, "Wiimote DUp", 103, sname="dup"),
+    partial(Button, "Wiimote DDown", 108, sname="ddown"),
+    partial(Button, "Wiimote DLeft", 105, sname="dleft"),
+    partial(Button, "Wiimote DRight", 106, sname="dright"),
+    partial(Button, "Wiimote -", 412, sname="select"),
+    partial(Button, "Wiimote +", 407, sname="start"),
+    partial(Button, "Wiimote home", 316, sname="home"),
+    partial(Button, "Wiimote 1", 257, sname="cross"),
+    partial(Button, "Wiimote 2", 258, sname="circle"),
+    partial(CentredAxis, "Wiimote Roll", -100, 100, 3, sname="roll"),
+    partial(CentredAxis, "Wiimote Pitch", -90, 125, 4, sname="pitch"),
+    partial(CentredAxis, "Wiimote ???", -90, 125, 5, sname="???"),
+    partial(CentredAxis, "Nunchuck Y", -100, 100, 17, sname="ry"),
+    partial(CentredAxis, "Nunchuck X", -100, 100, 16, sname="rx"),
+    partial(CentredAxis, "Classic lx", -32, 32, 18, sname="lx"),
+    partial(CentredAxis, "Classic ly", -32, 32, 19, sname="ly"),
+    partial(CentredAxis, "Classic rx", -32, 32, 20, sname="rx"),
+    partial(CentredAxis, "Classic ry", -32, 32, 21, sname="ly"),
+    partial(Button, "Classic x", 307, sname="square"),
+    partial(Button, "Classic y", 308, sname="triangle"),
+    partial(Button, "Classic zr", 313, sname="r2"),
+    partial(Button, "Classic zl", 312, sname="l2"),
+)
+
+
+_WIIMOTE_REGISTRATION_IDS = ((0x57e, 0x306),)
+
+
 class WiiMote(Controller):
     """
     Driver for the Nintendo WiiMote controller, the WiiMote
@@ -18,34 +53,7 @@ class WiiMote(Controller):
             Used to set the hot zone for each :class:`approxeng.input.CentredAxis` in the controller.
         """
         super(WiiMote, self).__init__(
-            controls=[
-                Button("Nunchuck Z", 309, sname="r1"),
-                Button("Nunchuck C", 306, sname="r2"),
-                Button("Wiimote A", 304, sname="cross"),
-                Button("Wiimote B", 305, sname="circle"),
-                Button("Wiimote DUp", 103, sname="dup"),
-                Button("Wiimote DDown", 108, sname="ddown"),
-                Button("Wiimote DLeft", 105, sname="dleft"),
-                Button("Wiimote DRight", 106, sname="dright"),
-                Button("Wiimote -", 412, sname="select"),
-                Button("Wiimote +", 407, sname="start"),
-                Button("Wiimote home", 316, sname="home"),
-                Button("Wiimote 1", 257, sname="cross"),
-                Button("Wiimote 2", 258, sname="circle"),
-                CentredAxis("Wiimote Roll", -100, 100, 3, sname="roll"),
-                CentredAxis("Wiimote Pitch", -90, 125, 4, sname="pitch"),
-                CentredAxis("Wiimote ???", -90, 125, 5, sname="???"),
-                CentredAxis("Nunchuck Y", -100, 100, 17, sname="ry"),
-                CentredAxis("Nunchuck X", -100, 100, 16, sname="rx"),
-                CentredAxis("Classic lx", -32, 32, 18, sname="lx"),
-                CentredAxis("Classic ly", -32, 32, 19, sname="ly"),
-                CentredAxis("Classic rx", -32, 32, 20, sname="rx"),
-                CentredAxis("Classic ry", -32, 32, 21, sname="ly"),
-                Button("Classic x", 307, sname="square"),
-                Button("Classic y", 308, sname="triangle"),
-                Button("Classic zr", 313, sname="r2"),
-                Button("Classic zl", 312, sname="l2"),
-            ],
+            controls=[control() for control in _WIIMOTE_CONTROLS],
             dead_zone=dead_zone,
             hot_zone=hot_zone,
             **kwargs)
@@ -53,9 +61,9 @@ class WiiMote(Controller):
     @staticmethod
     def registration_ids():
         """
-        :return: list of (vendor_id, product_id) for this controller
+        :return: tuple of (vendor_id, product_id) for this controller
         """
-        return [(0x57e, 0x306)]
+        return _WIIMOTE_REGISTRATION_IDS
 
     def __repr__(self):
         return 'Nintendo WiiMote controller'
@@ -1,6 +1,6 @@
 __author__ = 'tom'
 
-from setuptools import setup, find_namespace_packages
+from setuptools import setup
 
 # To build for local development use 'python setup.py develop'.
 # To upload a version to pypi use 'python setup.py clean sdist upload'.
@@ -14,14 +14,11 @@ setup(
     author='Tom Oinn',
     author_email='tomoinn@gmail.com',
     license='ASL2.0',
-    packages=find_namespace_packages(),
+    packages=['approxeng.input', 'approxeng.input.gui', 'approxeng.input.yaml_controllers'],
     install_requires=['evdev==1.6.1', 'pyyaml==6.0.1'],
     extras_require={':python_version<"3.7"': ['importlib-resources']},
     package_data={'approxeng.input.yaml_controllers': ['*.yaml']},
-    test_suite='nose.collector',
-    tests_require=['nose'],
-    dependency_links=[],
-    zip_safe=False,
+    zip_safe=True,
     entry_points={'console_scripts': ['approxeng_input_profile=approxeng.input.gui.profiler:profiler_main',
                                       'approxeng_input_show_controls=approxeng.input.gui.console:show_controls',
                                       'approxeng_input_list_devices=approxeng.input.gui.console:list_devices',